@@ -9,26 +9,51 @@ import csv
 import datetime as dt
 import logging
 import multiprocessing as mp
+from multiprocessing import util as mp_util
 import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
-from typing import List, Optional, Tuple
-from io import StringIO
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import FrozenSet, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import uuid
+from lxml import etree
 try:
-    from pandas.errors import XPathError
-except ImportError:        # pandas < 2.2
-    class XPathError(Exception):
-        """Dummy shim for old pandas versions."""
+    from pyarrow import ArrowInvalid   # optional, much faster CSV reader
+    # the pyarrow engine only honours on_bad_lines="skip" from pandas 2.2
+    _PD_VER = tuple(int(x) for x in re.findall(r"\d+", pd.__version__)[:2])
+    CSV_ENGINE = "pyarrow" if _PD_VER >= (2, 2) else "c"
+except ImportError:
+    CSV_ENGINE = "c"
+
+    class ArrowInvalid(Exception):
+        """Dummy shim when pyarrow isn't installed."""
         pass
 
 # ──────────────────────────── constants ────────────────────────────
 DEFAULT_LOGPARSER_PATH = r"LogParser.exe"
-ENC_RE = re.compile(rb'encoding="([^"]+)"', re.I)
+TIME_FMT = "%Y-%m-%d %H:%M:%S"       # CLI dates and LogParser timestamps
+EVT_SUFFIXES = (".evt", ".evtx")
+WEVTUTIL = "wevtutil"
+EVT_NS = "{http://schemas.microsoft.com/win/2004/08/events/event}"
+# LogParser's EVT schema – checks --columns and shapes wevtutil chunks
+LP_EVT_FIELDS = ["EventLog", "RecordNumber", "TimeGenerated", "TimeWritten",
+                 "EventID", "EventType", "EventTypeName", "EventCategory",
+                 "EventCategoryName", "SourceName", "Strings", "ComputerName",
+                 "SID", "Message", "Data"]
+EVENT_TYPE_NAMES = {1: "Error event", 2: "Warning event", 4: "Information event",
+                    8: "Success Audit event", 16: "Failure Audit event"}
+
+# (file, None) → whole file via LogParser; (file, (lo, hi)) → wevtutil slice
+Job = Tuple[str, Optional[Tuple[dt.datetime, dt.datetime]]]
+# most jobs per pool task – pipelined inside the worker, but the whole
+# batch's filtered frames are held and pickled back together
+MAX_JOB_BATCH = 4
 
 # ────────────────────────── argument parsing ───────────────────────
 def parse_args() -> argparse.Namespace:
@@ -55,32 +80,73 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--workers", type=int, default=max(1, mp.cpu_count() - 1),
                    help="Parallel worker processes (default: CPU cores – 1).")
     p.add_argument("--placeholder-char", default="§",
-                   help="Char that replaces commas inside string fields (default '§').")
+                   help="Char that replaces commas and double quotes inside "
+                        "string fields (default '§').")
+    p.add_argument("--split-mb", type=int, default=0,
+                   help="Split files bigger than this (MB) into parallel wevtutil "
+                        "time-window chunks (default 0 = never; see README for "
+                        "the fields such chunks leave empty).")
+    p.add_argument("--columns",
+                   help="Comma-separated column names to keep (default: all).")
     p.add_argument("--logparser", default=DEFAULT_LOGPARSER_PATH,
                    help="Path to LogParser.exe.")
     p.add_argument("--log-file", help="Write errors here (default <output>.log)")
-    return p.parse_args()
+    ns = p.parse_args()
+
+    if ns.columns:
+        # LogParser field names are case-insensitive; the frame's are not
+        known = {f.lower(): f for f in LP_EVT_FIELDS}
+        names = [c.strip() for c in ns.columns.split(",") if c.strip()]
+        names = [c for c in names if c.lower() != "sourcefile"]  # always added
+        bad = [c for c in names if c.lower() not in known]
+        if bad:
+            p.error(f"unknown --columns {', '.join(bad)} "
+                    f"(valid: {', '.join(LP_EVT_FIELDS)})")
+        if not names:
+            p.error("--columns needs at least one event field besides SourceFile")
+        ns.columns = list(dict.fromkeys(known[c.lower()] for c in names))
+    return ns
 
 
 # ───────────────────────── helper utilities ────────────────────────
-def _load_id_list(arg_val: Optional[str], file_path: Optional[str]) -> Optional[List[int]]:
+def _load_id_list(arg_val: Optional[str],
+                  file_path: Optional[str]) -> Optional[FrozenSet[int]]:
     ids: List[int] = []
     if arg_val:
         ids.extend(int(x.strip()) for x in arg_val.split(',') if x.strip())
     if file_path:
         with open(file_path, encoding="utf-8") as f:
             ids.extend(int(line.strip()) for line in f if line.strip())
-    return ids or None
+    return frozenset(ids) or None      # duplicate IDs dropped up front
+
+
+def _iter_event_files(root: str) -> Iterator[str]:
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return      # unreadable folder – skipped, same as os.walk()
+    with it:
+        for e in it:
+            try:
+                is_dir = e.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False      # os.walk() treats it as a file too
+            if is_dir:
+                yield from _iter_event_files(e.path)
+            elif e.name.lower().endswith(EVT_SUFFIXES):
+                yield e.path
 
 
 def _list_event_files(root: str) -> List[str]:
-    pat = re.compile(r".*\.(evtx?|evt)$", re.I)
-    return [os.path.join(dp, f) for dp, _, fs in os.walk(root)
-            for f in fs if pat.match(f)]
+    return list(_iter_event_files(root))
 
 
-def _log_error(log_file: str, msg: str) -> None:
-    logging.error(msg)
+def _log_error(log_file: str, msg: str, exc_info: bool = False) -> None:
+    if exc_info:                        # keep the traceback, not just str(exc)
+        logging.exception(msg)
+        msg = f"{msg}\n{traceback.format_exc().rstrip()}"
+    else:
+        logging.error(msg)
     try:
         with open(log_file, "a", encoding="utf-8") as fh:
             fh.write(msg + "\n")
@@ -88,95 +154,210 @@ def _log_error(log_file: str, msg: str) -> None:
         pass
 
 
-def _build_lp_cmd(lp: str, src: str, dst_xml: str) -> List[str]:
-    query = f"SELECT * INTO {dst_xml} FROM '{src}'"
+def _build_lp_cmd(lp: str, src: str, dst_csv: str,
+                  fields: Optional[List[str]] = None) -> List[str]:
+    select = ", ".join(fields) if fields else "*"
+    query = f"SELECT {select} INTO {dst_csv} FROM '{src}'"
     return [
         lp, query,
         "-i:EVT",          # EVT plug-in parses both .evt and .evtx
-        "-o:XML",
-        "-structure:1",    # <ROW> wrapper for every record  
+        "-o:CSV",
+        "-headers:ON",
+        "-oCodepage:65001",  # UTF-8, not the ANSI code page
+        "-stats:OFF",
         "-q:ON"
     ]
 
 
+def _utc_stamp(t: dt.datetime) -> str:
+    """Local naive datetime → the UTC form used by @SystemTime."""
+    return t.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _build_wevt_cmd(src: str, lo: dt.datetime, hi: dt.datetime,
+                    last: bool) -> List[str]:
+    # slices are half-open so neighbours never share an event; the last
+    # one runs to end + 1 s because LogParser truncates to the second, so
+    # an event at end.4 still counts as inside the user's inclusive end
+    if last:
+        hi += dt.timedelta(seconds=1)
+    query = (f"*[System[TimeCreated[@SystemTime>='{_utc_stamp(lo)}' and "
+             f"@SystemTime<'{_utc_stamp(hi)}']]]")
+    return [WEVTUTIL, "qe", src, "/lf:true", f"/q:{query}", "/e:root"]
+
+
+def _split_window(start: dt.datetime, end: dt.datetime,
+                  parts: int) -> List[Tuple[dt.datetime, dt.datetime]]:
+    """Cut [start, end] into at most *parts* slices of at least one hour."""
+    span = end - start
+    n = max(1, min(parts, span // dt.timedelta(hours=1)))
+    # boundaries from start, not a rounded step – no trailing µs sliver
+    cuts = [start + span * k / n for k in range(n)] + [end]
+    return list(zip(cuts, cuts[1:]))
+
+
+def _plan_jobs(files: List[str], start: dt.datetime, end: dt.datetime,
+               parts: int, split_bytes: int) -> List[Job]:
+    wevt = split_bytes > 0 and shutil.which(WEVTUTIL)
+    jobs: List[Job] = []
+    for fp in files:
+        try:
+            big = wevt and os.path.getsize(fp) > split_bytes
+        except OSError:
+            big = False                 # let the worker report it
+        if big:
+            slices = _split_window(start, end, parts)
+            logging.info("%s: large log – %d wevtutil chunks", fp, len(slices))
+            jobs.extend((fp, w) for w in slices)
+        else:
+            jobs.append((fp, None))
+    return jobs
+
+
+def _batch_jobs(jobs: List[Job], workers: int) -> List[List[Job]]:
+    """
+    Deal *jobs* into pool tasks: small enough that every worker gets one
+    before any gets two, and dealt round-robin so the slices of one big
+    file land in different batches (and so in different processes).
+    """
+    n = min(len(jobs), max(workers, -(-len(jobs) // MAX_JOB_BATCH)))
+    return [jobs[k::n] for k in range(n)]
+
+
 def _filter_frame(df, start, end, incl, excl, placeholder):
-    df = df.copy()
+    # *df* is freshly built by the worker – never copied, sliced once
+    mask = np.ones(len(df), dtype=bool)
+    parsed = None
     if "TimeGenerated" in df.columns:
-        df["TimeGenerated"] = pd.to_datetime(df["TimeGenerated"], errors="coerce")
-        df = df[(df["TimeGenerated"] >= start) & (df["TimeGenerated"] <= end)]
+        tg = df["TimeGenerated"]
+        if not pd.api.types.is_datetime64_any_dtype(tg):
+            # read_csv couldn't parse it – LogParser timestamps sort
+            # lexically, so cut on the strings and parse only the rest
+            rough = (tg >= start.strftime(TIME_FMT)) & (tg <= end.strftime(TIME_FMT))
+            tg = parsed = pd.to_datetime(tg[rough], errors="coerce").reindex(df.index)
+        mask &= tg.between(start, end).to_numpy(dtype=bool)
 
     if incl is not None and "EventID" in df.columns:
-        df = df[df["EventID"].isin(incl)]
+        mask &= df["EventID"].isin(incl).to_numpy(dtype=bool)
     if excl is not None and "EventID" in df.columns:
-        df = df[~df["EventID"].isin(excl)]
+        mask &= ~df["EventID"].isin(excl).to_numpy(dtype=bool)
+    df = df.loc[mask]
 
     # ---- Force every object cell to displayable str ----------
-    obj_cols = df.select_dtypes(include=["object"]).columns
+    clean = {} if parsed is None else {"TimeGenerated": parsed[mask]}
+    obj_cols = [c for c in df.select_dtypes(include=["object"]).columns
+                if c not in clean]
+    # commas/quotes → placeholder, line breaks → space: one record per line
+    table = str.maketrans({",": placeholder, '"': placeholder,
+                           "\n": " ", "\r": " "})
     for col in obj_cols:
-        df[col] = df[col].apply(
-            lambda x: (x.decode("utf-16le", "ignore")          # bytes → str
-                       if isinstance(x, (bytes, bytearray))
-                       else str(x))
-        ).str.replace(",", placeholder, regex=False)
-    return df
-
-
-def _detect_xml_encoding(raw: bytes) -> str:
-    """Return a guessed Python codec name for LogParser XML."""
-    # BOM beats everything
-    if raw.startswith(b"\xff\xfe"):
-        return "utf-16le"
-    if raw.startswith(b"\xfe\xff"):
-        return "utf-16be"
-
-    # Parse the encoding attribute in the XML declaration
-    m = ENC_RE.search(raw[:200])
-    if m:
-        enc = m.group(1).decode("ascii", "ignore").lower()
-        if enc in {
-            "iso-10646-ucs-2", "utf-16", "utf-16le", "utf-16be",
-            "ucs-2", "unicode"
-        }:
-            return "utf-16le"
-        return enc
-
-    # Fallback
-    return "utf-8"
-
-def _safe_read_xml(path: str) -> Optional[pd.DataFrame]:
+        vals = df[col].to_numpy()
+        # one map(type) pass builds the mask; only bytes cells get decoded
+        is_bytes = np.fromiter((t is bytes or t is bytearray
+                                for t in map(type, vals)),
+                               dtype=bool, count=len(vals))
+        if is_bytes.any():                                # bytes → str
+            vals = vals.copy()
+            vals[is_bytes] = [v.decode("utf-16le", "ignore") for v in vals[is_bytes]]
+        clean[col] = (pd.Series(vals, index=df.index).astype("string")
+                      .str.translate(table))
+    # one assign() on the (already filtered) frame instead of N slice writes
+    return df.assign(**clean)
+
+
+def _utc_to_local(stamp: Optional[str]) -> Optional[dt.datetime]:
+    try:
+        t = dt.datetime.strptime(stamp[:19], "%Y-%m-%dT%H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+    # LogParser reports local time, so chunks do too
+    return t.replace(tzinfo=dt.timezone.utc).astimezone().replace(tzinfo=None)
+
+
+def _event_row(ev, src: str) -> dict:
+    """Map one wevtutil <Event> onto LogParser's EVT field names."""
+    system = ev.find(f"{EVT_NS}System")
+
+    def node(tag):
+        return system.find(EVT_NS + tag) if system is not None else None
+
+    def text(tag):
+        el = node(tag)
+        return el.text if el is not None else None
+
+    def attr(tag, name):
+        el = node(tag)
+        return el.get(name) if el is not None else None
+
+    keywords = int(text("Keywords") or "0", 16)
+    if keywords & 0x0020000000000000:
+        ev_type = 8                     # audit success
+    elif keywords & 0x0010000000000000:
+        ev_type = 16                    # audit failure
+    else:
+        ev_type = {"1": 1, "2": 1, "3": 2}.get(text("Level"), 4)
+
+    data = ev.find(f"{EVT_NS}EventData")
+    if data is None:
+        data = ev.find(f"{EVT_NS}UserData")
+    strings = None
+    if data is not None:                # leaf values, '|'-joined like LogParser
+        strings = "|".join(el.text or "" for el in data.iter(etree.Element)
+                           if el is not data and len(el) == 0)
+
+    stamp = _utc_to_local(attr("TimeCreated", "SystemTime"))
+    return {
+        "EventLog": src,
+        "RecordNumber": text("EventRecordID"),
+        "TimeGenerated": stamp,
+        "TimeWritten": stamp,
+        "EventID": text("EventID"),
+        "EventType": ev_type,
+        "EventTypeName": EVENT_TYPE_NAMES[ev_type],
+        "EventCategory": text("Task"),
+        "SourceName": attr("Provider", "Name"),
+        "Strings": strings,
+        "ComputerName": text("Computer"),
+        "SID": attr("Security", "UserID"),
+    }
+
+
+def _read_event_xml(path: str, src: str) -> Optional[pd.DataFrame]:
     """
-    Parse LogParser XML with unknown encoding.
-    Returns DataFrame or None (if no <ROW> elements).
+    Stream wevtutil XML one <Event> at a time.
+    Returns DataFrame or None (if no events).
     """
-    try:
-        # fast path – let pandas try with its own sniffing
-        return pd.read_xml(path, xpath="//ROW")
-    except (XPathError, ValueError):
-        pass          # either no nodes or encoding blew up
-
-    # Manual decode
+    rows: List[dict] = []
     with open(path, "rb") as fh:
-        raw = fh.read()
+        ctx = etree.iterparse(fh, events=("end",), tag=f"{EVT_NS}Event",
+                              recover=True, huge_tree=True)
+        for _, ev in ctx:
+            rows.append(_event_row(ev, src))
+            # drop the finished event and every sibling before it
+            ev.clear()
+            while ev.getprevious() is not None:
+                del ev.getparent()[0]
+        del ctx
+
+    if not rows:
+        return None
+    df = pd.DataFrame.from_records(rows, columns=LP_EVT_FIELDS)
+    for col, kind in (("RecordNumber", "Int64"), ("EventID", "Int32")):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype(kind)
+    return df
 
-    enc = _detect_xml_encoding(raw)
-    txt = raw.decode(enc, errors="ignore")
-
-    try:
-        return pd.read_xml(StringIO(txt), xpath="//ROW")
-    except XPathError:
-        return Non
 
 def _safe_copy(src: str, dst_dir: str) -> str:
     """
     Copy or hard-link *src* into *dst_dir* with a name that has no '%'
-    characters (Log Parser chokes on them). Returns the new path.
+    characters (Log Parser chokes on them). Returns the new path, or
+    *src* itself when the whole path – folders included – is clean.
     Uses a hard-link when the source and destination are on the same
     drive, so there’s no 100 GB copy penalty.
     """
+    if "%" not in src:
+        return src                      # nothing to fix – no link/copy
     clean_name = re.sub(r"%+", "_", os.path.basename(src))
-    if "%" in clean_name or clean_name == os.path.basename(src):
-        # keep basename if it had no %
-        pass
     tmp_path = os.path.join(dst_dir, f"{uuid.uuid4().hex}_{clean_name}")
     try:
         os.link(src, tmp_path)          # cheap, same-drive hard-link
@@ -185,42 +366,148 @@ def _safe_copy(src: str, dst_dir: str) -> str:
     return tmp_path
 
 # ────────────────────── multiprocessing worker ─────────────────────
-def _worker(job: Tuple[str, str, dt.datetime, dt.datetime,
-                       Optional[List[int]], Optional[List[int]],
-                       str, str]) -> Optional[pd.DataFrame]:
-    (fp, lp, sdt, edt, incl, excl, ph, logf) = job
-    tmp_dir = tempfile.mkdtemp(prefix="evtfilter_")
+# run-wide settings, filled once per child by the Pool initializer
+_INIT: dict = {}
+
+
+def _init(lp: str, sdt: dt.datetime, edt: dt.datetime,
+          incl: Optional[FrozenSet[int]], excl: Optional[FrozenSet[int]],
+          ph: str, logf: str, cols: Optional[List[str]]) -> None:
+    _INIT.update(lp=lp, sdt=sdt, edt=edt, incl=incl, excl=excl,
+                 ph=ph, logf=logf, cols=cols)
+    # what LogParser must emit: the kept columns plus what the filters read
+    _INIT["fields"] = (list(dict.fromkeys(cols + ["TimeGenerated", "EventID"]))
+                       if cols else None)
+    # one scratch dir for the child's lifetime, not one per file;
+    # atexit never fires in pool children, their finalizers do
+    _INIT["tmp_dir"] = tempfile.mkdtemp(prefix=f"evtfilter_{os.getpid()}_")
+    mp_util.Finalize(None, shutil.rmtree, args=(_INIT["tmp_dir"], True),
+                     exitpriority=0)
+
+
+def _run_logparser(fp: str, src: str, tmp_csv: str) -> bool:
+    # one raw pipe, drained in 1 MiB reads; only decoded on failure
+    # (LogParser prints its errors on stdout, so it can't go to DEVNULL)
+    run = subprocess.run(
+        _build_lp_cmd(_INIT["lp"], src, tmp_csv, _INIT["fields"]),
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1 << 20
+    )
+    if run.returncode:
+        out = run.stdout.decode(errors="replace").strip()
+        _log_error(_INIT["logf"], f"LogParser failed ({run.returncode}) on {fp}:\n"
+                                  f"OUTPUT: {out}")
+        return False
+    if not os.path.isfile(tmp_csv) or os.path.getsize(tmp_csv) == 0:
+        logging.info("%s: log contained 0 events", fp)
+        return False
+    return True
+
+
+def _run_wevtutil(fp: str, window: Tuple[dt.datetime, dt.datetime],
+                  tmp_xml: str) -> bool:
+    lo, hi = window
+    with open(tmp_xml, "wb") as fh:
+        run = subprocess.run(_build_wevt_cmd(fp, lo, hi, hi >= _INIT["edt"]),
+                             stdout=fh, stderr=subprocess.PIPE)
+    if run.returncode:
+        err = run.stderr.decode(errors="replace").strip()
+        _log_error(_INIT["logf"], f"wevtutil failed ({run.returncode}) on {fp} "
+                                  f"[{lo} – {hi}]:\nSTDERR: {err}")
+        return False
+    return True
+
+
+def _export(job: Job, temps: List[str]) -> Optional[str]:
+    """
+    Stage 1 – run LogParser (or wevtutil for a slice) into the scratch dir.
+    Returns the exported file, or None if there is nothing to read.
+    Every temp file created is appended to *temps* for the caller to remove.
+    """
+    fp, window = job
+    tag = uuid.uuid4().hex              # two jobs share the dir at once
+    if window:              # big-file slice – straight to the XML reader
+        out = os.path.join(_INIT["tmp_dir"], f"wevt_{tag}.xml")
+        temps.append(out)
+        return out if _run_wevtutil(fp, window, out) else None
+
+    safe_src = _safe_copy(fp, _INIT["tmp_dir"])   # <- NEW
+    if safe_src != fp:                  # never delete the evidence file
+        temps.append(safe_src)
+    out = os.path.join(_INIT["tmp_dir"], f"lp_{tag}.csv")
+    temps.append(out)
+    return out if _run_logparser(fp, safe_src, out) else None
+
+
+def _load(job: Job, path: str) -> Optional[pd.DataFrame]:
+    """Stage 2 – parse what _export() wrote."""
+    fp, window = job
+    if window:
+        return _read_event_xml(path, fp)
+
+    # ---------- CSV → DataFrame ----------
+    opts = dict(encoding="utf-8-sig", encoding_errors="replace",
+                dtype={"EventID": "Int32"},
+                parse_dates=["TimeGenerated"],
+                on_bad_lines="skip")
     try:
-        safe_src = _safe_copy(fp, tmp_dir)        # <- NEW
-        tmp_xml  = os.path.join(tmp_dir, "lp.xml")
-
-        # ---------- run Log Parser ----------
-        run = subprocess.run(
-            _build_lp_cmd(lp, safe_src, tmp_xml),
-            capture_output=True, text=True
-        )
-        if run.returncode:
-            _log_error(logf, f"LogParser failed ({run.returncode}) on {fp}:\n"
-                             f"STDERR: {run.stderr.strip()}\nSTDOUT: {run.stdout.strip()}")
-            return None
-        if not os.path.isfile(tmp_xml) or os.path.getsize(tmp_xml) == 0:
-            logging.info("%s: log contained 0 events", fp)
+        return pd.read_csv(path, engine=CSV_ENGINE, **opts)
+    except (UnicodeDecodeError, ArrowInvalid, pd.errors.ParserError):
+        if CSV_ENGINE == "c":
+            raise
+        # pyarrow ignores encoding_errors – the C engine replaces bad bytes
+        logging.info("%s: pyarrow reader failed, retrying with the C engine", fp)
+        return pd.read_csv(path, engine="c", **opts)
+
+
+def _process(job: Job, export: Future,
+             temps: List[str]) -> Optional[Tuple[str, pd.DataFrame]]:
+    fp = job[0]
+    try:
+        path = export.result()
+        if path is None:
             return None
-
-        # ---------- XML → DataFrame ----------
-        df = _safe_read_xml(tmp_xml)
+        df = _load(job, path)
         if df is None or df.empty:
             logging.info("%s: no events in selected time-window", fp)
             return None
-        df = _filter_frame(df, sdt, edt, incl, excl, ph)
-        df["SourceFile"] = fp
-        return df
+        df = _filter_frame(df, _INIT["sdt"], _INIT["edt"],
+                           _INIT["incl"], _INIT["excl"], _INIT["ph"])
+        if _INIT["cols"]:
+            df = df[_INIT["cols"]]
+        return fp, df
 
     except Exception as exc:
-        _log_error(logf, f"Exception processing {fp}: {exc}")
+        _log_error(_INIT["logf"], f"Exception processing {fp}: {exc!r}",
+                   exc_info=True)
         return None
     finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        # keep the scratch dir's footprint at a couple of files' worth
+        for tmp in temps:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def _worker(batch: List[Job]) -> List[Tuple[str, pd.DataFrame]]:
+    """
+    Two-stage pipeline over *batch*: a helper thread runs the next job's
+    LogParser/wevtutil export while this thread parses the previous one.
+    The export is another process waiting on disk, and the parsers spend
+    most of their time in C, so the two stages overlap rather than queue.
+    """
+    results = []
+    temps: List[List[str]] = [[] for _ in batch]
+    with ThreadPoolExecutor(max_workers=1) as exporter:
+        nxt = exporter.submit(_export, batch[0], temps[0])
+        for i, job in enumerate(batch):
+            cur = nxt
+            if i + 1 < len(batch):      # queue N+1 before parsing N
+                nxt = exporter.submit(_export, batch[i + 1], temps[i + 1])
+            res = _process(job, cur, temps[i])
+            if res is not None:
+                results.append(res)
+    return results
 
 
 # ────────────────────────────── main ───────────────────────────────
@@ -233,35 +520,53 @@ def main() -> None:
                                   logging.FileHandler(ns.log_file,
                                                       delay=True, encoding="utf-8")])
 
-    start_dt = dt.datetime.strptime(ns.start_date, "%Y-%m-%d %H:%M:%S")
-    end_dt = dt.datetime.strptime(ns.end_date, "%Y-%m-%d %H:%M:%S")
+    start_dt = dt.datetime.strptime(ns.start_date, TIME_FMT)
+    end_dt = dt.datetime.strptime(ns.end_date, TIME_FMT)
 
     inc_ids = _load_id_list(ns.event_ids, ns.event_ids_file)
     exc_ids = _load_id_list(ns.exclude_event_ids, ns.exclude_event_ids_file)
-
     files = _list_event_files(ns.dir)
     if not files:
         sys.exit(f"No .evt/.evtx files under {ns.dir}")
 
     logging.info("Scanning %d files …", len(files))
-    pool_args = [(f, ns.logparser, start_dt, end_dt,
-                  inc_ids, exc_ids, ns.placeholder_char, ns.log_file)
-                 for f in files]
-
-    with mp.Pool(processes=ns.workers) as pool:
-        frames = [df for df in pool.map(_worker, pool_args)
-                  if df is not None and not df.empty]
-
-    if not frames:
+    jobs = _plan_jobs(files, start_dt, end_dt, ns.workers, ns.split_mb << 20)
+    batches = _batch_jobs(jobs, ns.workers)
+
+    # stream each batch's frames straight to disk – peak RAM is about one
+    # batch (≤ MAX_JOB_BATCH frames) per worker, not the whole result set;
+    # recycled workers hand back their arenas
+    rows = 0
+    cols: List[str] = []
+    with open(ns.output, "w", newline="", encoding="utf-8") as out, \
+            mp.Pool(processes=ns.workers, maxtasksperchild=50,
+                    initializer=_init,
+                    initargs=(ns.logparser, start_dt, end_dt, inc_ids, exc_ids,
+                              ns.placeholder_char, ns.log_file,
+                              ns.columns)) as pool:
+        for results in pool.imap_unordered(_worker, batches):
+            for fp, df in results:
+                if df.empty:
+                    continue
+                if not cols:
+                    cols = list(df.columns)
+                # keep SourceFile as last column
+                df = df.reindex(columns=cols)
+                df["SourceFile"] = fp
+                df.to_csv(out, index=False, header=not rows,
+                          quoting=csv.QUOTE_MINIMAL)
+                rows += len(df)
+            del results
+        # let the children exit normally so their scratch dirs are removed
+        pool.close()
+        pool.join()
+
+    if not rows:
+        os.remove(ns.output)
         logging.warning("No matching events found.")
         return
 
-    agg = pd.concat(frames, ignore_index=True)
-    # keep SourceFile as last column
-    cols = [c for c in agg.columns if c != "SourceFile"] + ["SourceFile"]
-    agg[cols].to_csv(ns.output, index=False, quoting=csv.QUOTE_MINIMAL)
-
-    logging.info("Done. %d rows → %s", len(agg), ns.output)
+    logging.info("Done. %d rows → %s", rows, ns.output)
 
 
 if __name__ == "__main__":